@@ -8,12 +8,19 @@ if it already exists.
 """
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from settings import Settings
 from sk_connectors import get_connector
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,14 +69,15 @@ class NotionReleaseNotes:
                 "object": "block",
             })
             # Split summary into chunks if it's too long (Notion limit is 2000 chars per block)
-            for i in range(0, len(summary), 1900):
-                chunk = summary[i:i+1900]
-                children.append({
+            children.extend(
+                {
                     "paragraph": {
-                        "rich_text": [{"text": {"content": chunk}}]
+                        "rich_text": [{"text": {"content": summary[i:i+1900]}}]
                     },
                     "object": "block",
-                })
+                }
+                for i in range(0, len(summary), 1900)
+            )
 
         # Add commits section if we have commits
         if commits:
@@ -77,19 +85,15 @@ class NotionReleaseNotes:
                 "heading_2": {"rich_text": [{"text": {"content": "Commits"}}]},
                 "object": "block",
             })
-            for c in commits:
-                msg = (c.get("commit", {}).get("message") or c.get("message") or "").split("\n")[0]
-                author = (c.get("author", {}) or {}).get("login") or (c.get("commit", {}).get("author", {}).get("name"))
-                sha = c.get("sha", "")[:7]
-                line = f"{msg} ({sha})"
-                if author:
-                    line = f"{line} — {author}"
-                children.append({
+            children.extend(
+                {
                     "bulleted_list_item": {
-                        "rich_text": [{"text": {"content": line}}]
+                        "rich_text": [{"text": {"content": _commit_line(c)}}]
                     },
                     "object": "block",
-                })
+                }
+                for c in commits
+            )
 
         return children
 
@@ -191,14 +195,25 @@ class NotionReleaseNotes:
         return None
 
 
+def _commit_fields(c: Dict[str, Any]) -> Tuple[str, Optional[str], str]:
+    """Extract (subject line, author, short sha) from a GitHub commit payload."""
+    inner = c.get("commit") or {}
+    msg = inner.get("message") or c.get("message") or ""
+    author = (c.get("author") or {}).get("login") or (inner.get("author") or {}).get("name")
+    return msg.partition("\n")[0], author, (c.get("sha") or "")[:7]
+
+
+def _commit_line(c: Dict[str, Any]) -> str:
+    """Render a commit as "subject (sha) — author" for a Notion bullet."""
+    msg, author, sha = _commit_fields(c)
+    return f"{msg} ({sha}) — {author}" if author else f"{msg} ({sha})"
+
+
 def summarize_commits_simple(commits: List[Dict[str, Any]], limit: int = 8) -> str:
     """Create a simple bullet summary from commit messages."""
     if not commits:
         return ""
-    bullets = []
-    for c in commits[:limit]:
-        msg = (c.get("commit", {}).get("message") or c.get("message") or "").split("\n")[0]
-        bullets.append(f"• {msg}")
+    bullets = [f"• {_commit_fields(c)[0]}" for c in commits[:limit]]
     if len(commits) > limit:
         bullets.append(f"• … and {len(commits) - limit} more")
     return "\n".join(bullets)
@@ -210,17 +225,33 @@ def _resolve_identifier() -> Optional[str]:
     Order:
     1) First entry in user_mapping.json with scalekit_identifier
     2) Settings.SCALEKIT_DEFAULT_IDENTIFIER
+
+    The mapping file is only re-parsed when its modification time changes.
     """
+    mpath = Path(Settings.USER_MAPPING_FILE)
+    try:
+        mtime = mpath.stat().st_mtime
+    except OSError:
+        mtime = None
+    return _identifier_from_mapping(str(mpath), mtime) or Settings.SCALEKIT_DEFAULT_IDENTIFIER
+
+
+@functools.lru_cache(maxsize=8)
+def _identifier_from_mapping(path: str, mtime: Optional[float]) -> Optional[str]:
+    """Return the first scalekit_identifier in the mapping file (cached per path/mtime)."""
+    if mtime is None:
+        return None
     try:
-        import json as _json
-        from pathlib import Path
-        mpath = Path(Settings.USER_MAPPING_FILE)
-        if mpath.exists():
-            mappings = _json.loads(mpath.read_text() or "{}")
-            for _, info in mappings.items():
-                ident = (info or {}).get("scalekit_identifier")
-                if ident:
-                    return ident
+        raw = Path(path).read_bytes() or b"{}"
+        if orjson is not None:
+            mappings = orjson.loads(raw)
+        else:
+            import json as _json
+            mappings = _json.loads(raw)
+        for _, info in mappings.items():
+            ident = (info or {}).get("scalekit_identifier")
+            if ident:
+                return ident
     except Exception:
         pass
-    return Settings.SCALEKIT_DEFAULT_IDENTIFIER
+    return None
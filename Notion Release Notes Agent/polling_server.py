@@ -14,16 +14,24 @@ Example:
 import argparse
 import json
 import logging
+import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from notion_service import NotionReleaseNotes
+from notion_service import NotionReleaseNotes, _resolve_identifier
 from settings import Settings
 from sk_connectors import get_connector
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,13 +41,36 @@ logging.basicConfig(
 logger = logging.getLogger("polling-agent")
 
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file, using orjson when it is installed"""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Serialize data to a JSON file, using orjson when it is installed.
+
+    Writes to a temporary sibling file and swaps it in with os.replace so a
+    crash mid-write never leaves a truncated file behind.
+    """
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
 class PollingAgent:
     """Polls GitHub for merged PRs and creates Notion pages"""
 
     def __init__(self, interval: int = 60):
         self.interval = interval
         self.seen_prs: Set[int] = set()
+        self._state_lock = threading.Lock()
         self.state_file = Path("polling_state.json")
+        self.repo_full_name = f"{Settings.GITHUB_REPO_OWNER}/{Settings.GITHUB_REPO_NAME}"
         self.connector = get_connector()
         logger.info(f"✅ Polling agent initialized (check every {interval}s)")
 
@@ -47,27 +78,31 @@ class PollingAgent:
         self._load_state()
 
     def _load_state(self):
-        """Load previously seen PR numbers from state file"""
+        """
+        Load previously seen PR numbers from state file
+
+        Numbers are normalized to int once here (older state files stored
+        floats), so seen_prs keys are guaranteed int everywhere else.
+        """
         if self.state_file.exists():
             try:
-                with open(self.state_file, "r") as f:
-                    state = json.load(f)
-                    self.seen_prs = set(state.get("seen_prs", []))
-                    logger.info(f"📋 Loaded {len(self.seen_prs)} previously seen PRs")
+                state = _read_json(self.state_file)
+                self.seen_prs = {int(n) for n in state.get("seen_prs", [])}
+                logger.info(f"📋 Loaded {len(self.seen_prs)} previously seen PRs")
             except Exception as e:
                 logger.warning(f"⚠️ Could not load state file: {e}")
 
     def _save_state(self):
         """Save seen PR numbers to state file"""
         try:
-            with open(self.state_file, "w") as f:
-                json.dump({"seen_prs": list(self.seen_prs)}, f)
+            _write_json(self.state_file, {"seen_prs": list(self.seen_prs)})
         except Exception as e:
             logger.warning(f"⚠️ Could not save state file: {e}")
 
-    def _get_recent_merged_prs(self) -> List[Dict[str, Any]]:
+    def _get_new_merged_prs(self, lookback_hours: int) -> List[Dict[str, Any]]:
         """
-        Fetch recently merged PRs from GitHub
+        Fetch PRs merged in the last ``lookback_hours`` hours that are not yet
+        in seen_prs, filtering on merge state, window and seen state in one pass
 
         Returns list of PRs with structure:
         {
@@ -80,8 +115,13 @@ class PollingAgent:
             "user": {"login": "username"}
         }
         """
+        # An empty lookback window can't contain any merges; skip the API call
+        if lookback_hours <= 0:
+            logger.info("⏭️  Lookback window is empty; skipping PR fetch")
+            return []
+
         try:
-            logger.info(f"🔍 Checking for merged PRs in {Settings.GITHUB_REPO_OWNER}/{Settings.GITHUB_REPO_NAME}")
+            logger.info(f"🔍 Checking for merged PRs in {self.repo_full_name}")
 
             # Use Scalekit GitHub tool to list PRs
             result = self.connector.execute_action_with_retry(
@@ -91,7 +131,7 @@ class PollingAgent:
                     "owner": Settings.GITHUB_REPO_OWNER,
                     "repo": Settings.GITHUB_REPO_NAME,
                     "state": "closed",  # Get closed PRs
-                    "per_page": 30,  # Check last 30 closed PRs
+                    "per_page": Settings.GITHUB_PRS_PER_PAGE,  # Most recently updated closed PRs
                     "sort": "updated",
                     "direction": "desc"
                 },
@@ -106,33 +146,41 @@ class PollingAgent:
 
             logger.info(f"📋 Found {len(all_prs)} closed PRs total")
 
-            # Filter for merged PRs in last 24 hours
-            merged_prs = []
+            # Filter for unseen merged PRs inside the lookback window
+            new_prs = []
+            already_seen = 0
             now = datetime.now(timezone.utc)
-            cutoff = now - timedelta(hours=24)
+            cutoff = now - timedelta(hours=lookback_hours)
 
             for pr in all_prs:
                 # Check if PR was merged (not just closed)
                 if pr.get("merged_at"):
+                    # Skip PRs we already processed before parsing anything
+                    if pr.get("number") in self.seen_prs:
+                        already_seen += 1
+                        continue
                     # Parse merge time
                     merged_at_str = pr.get("merged_at")
                     try:
                         # GitHub returns UTC times with 'Z' suffix
                         merged_at = datetime.fromisoformat(merged_at_str.replace("Z", "+00:00"))
-                        # Only include PRs merged in last 24 hours
+                        # Only include PRs merged inside the lookback window
                         if merged_at >= cutoff:
-                            merged_prs.append(pr)
+                            new_prs.append(pr)
                     except Exception as e:
                         logger.warning(f"⚠️ Could not parse merge time for PR #{pr.get('number')}: {e}")
 
-            logger.info(f"✅ Found {len(merged_prs)} merged PRs in last 24 hours")
-            return merged_prs
+            logger.info(
+                f"✅ Found {len(new_prs)} new merged PRs in last {lookback_hours} hours "
+                f"({already_seen} already processed)"
+            )
+            return new_prs
 
         except Exception as e:
             logger.error(f"❌ Error fetching PRs: {e}", exc_info=True)
             return []
 
-    def _process_pr(self, pr: Dict[str, Any]) -> bool:
+    def _process_pr(self, pr: Dict[str, Any], slack_identifier: Optional[str]) -> bool:
         """
         Process a single merged PR
 
@@ -172,7 +220,7 @@ class PollingAgent:
                 title=title or f"PR #{pr_number} merged",
                 pr_sha=pr_context["merge_commit_sha"] or f"pr-{pr_number}",
                 pr_number=pr_number,
-                repo=f"{Settings.GITHUB_REPO_OWNER}/{Settings.GITHUB_REPO_NAME}",
+                repo=self.repo_full_name,
                 status="Merged",
                 commits=[],  # Not fetching commits
                 summary=summary,
@@ -183,11 +231,12 @@ class PollingAgent:
                 logger.info(f"✅ Created Notion page: {notion_url}")
 
                 # Post to Slack
-                self._post_slack_notification(pr_context, notion_url)
+                self._post_slack_notification(pr_context, notion_url, slack_identifier)
 
-                # Mark as seen
-                self.seen_prs.add(pr_number)
-                self._save_state()
+                # Mark as seen (PRs may be processed concurrently)
+                with self._state_lock:
+                    self.seen_prs.add(pr_number)
+                    self._save_state()
 
                 return True
             else:
@@ -199,37 +248,24 @@ class PollingAgent:
             return False
 
 
-    def _post_slack_notification(self, pr_context: Dict[str, Any], notion_url: str):
+    def _post_slack_notification(
+        self,
+        pr_context: Dict[str, Any],
+        notion_url: str,
+        scalekit_identifier: Optional[str],
+    ):
         """Post Slack notification about new Notion page"""
         if not Settings.SLACK_ANNOUNCE_CHANNEL:
             logger.info("SLACK_ANNOUNCE_CHANNEL not set; skipping Slack notification")
             return
+        if not scalekit_identifier:
+            logger.warning("⚠️ No scalekit_identifier found in user_mapping.json or SCALEKIT_DEFAULT_IDENTIFIER; skipping Slack notification")
+            return
         try:
-            # Load user mapping
-            user_mapping_file = Path(Settings.USER_MAPPING_FILE)
-            if not user_mapping_file.exists():
-                logger.warning("⚠️ user_mapping.json not found, skipping Slack notification")
-                return
-
-            with open(user_mapping_file, "r") as f:
-                user_mapping = json.load(f)
-
-            if not user_mapping:
-                logger.warning("⚠️ user_mapping.json is empty, skipping Slack notification")
-                return
-
-            # Use first user's identifier
-            first_user = next(iter(user_mapping.values()))
-            scalekit_identifier = first_user.get("scalekit_identifier")
-
-            if not scalekit_identifier:
-                logger.warning("⚠️ No scalekit_identifier in user_mapping.json")
-                return
-
             # Send Slack message
             message = (
                 f"Release notes for PR #{pr_context['number']} merged in "
-                f"{Settings.GITHUB_REPO_OWNER}/{Settings.GITHUB_REPO_NAME}:\n"
+                f"{self.repo_full_name}:\n"
                 f"{notion_url}"
             )
 
@@ -256,27 +292,29 @@ class PollingAgent:
         logger.info(f"🔄 Starting polling cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
         try:
-            # Fetch recently merged PRs
-            merged_prs = self._get_recent_merged_prs()
+            # Fetch recently merged PRs we haven't seen before
+            new_prs = self._get_new_merged_prs(Settings.POLL_MERGED_LOOKBACK_HOURS)
 
-            if not merged_prs:
+            if not new_prs:
                 logger.info("✅ No new merged PRs found")
                 return
 
-            # Process new PRs (ones we haven't seen before)
-            new_prs = [pr for pr in merged_prs if pr.get("number") not in self.seen_prs]
+            logger.info(f"🎯 Found {len(new_prs)} new merged PRs to process")
 
-            if not new_prs:
-                logger.info(f"✅ All {len(merged_prs)} merged PRs already processed")
-                return
+            # Resolve the Slack identifier once for the whole cycle (same
+            # resolution as the webhook server and Notion upserts)
+            slack_identifier = _resolve_identifier() if Settings.SLACK_ANNOUNCE_CHANNEL else None
 
-            logger.info(f"🎯 Found {len(new_prs)} new merged PRs to process")
+            def process(pr: Dict[str, Any]) -> bool:
+                ok = self._process_pr(pr, slack_identifier)
+                # Small delay per worker to avoid rate limits
+                time.sleep(Settings.POLL_PR_DELAY_SECONDS)
+                return ok
 
-            # Process each new PR
-            for pr in new_prs:
-                self._process_pr(pr)
-                # Small delay between PRs to avoid rate limits
-                time.sleep(2)
+            # PRs are independent, so process them concurrently
+            max_workers = max(1, min(Settings.POLL_MAX_CONCURRENT, len(new_prs)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(process, new_prs))
 
             logger.info(f"✅ Polling cycle complete - processed {len(new_prs)} PRs")
 
@@ -287,7 +325,7 @@ class PollingAgent:
         """Run continuous polling loop"""
         logger.info("=" * 60)
         logger.info("🚀 Starting GitHub Polling Agent")
-        logger.info(f"📍 Repository: {Settings.GITHUB_REPO_OWNER}/{Settings.GITHUB_REPO_NAME}")
+        logger.info(f"📍 Repository: {self.repo_full_name}")
         logger.info(f"⏱️  Poll interval: {self.interval} seconds")
         db_id_display = (Settings.NOTION_DATABASE_ID[:20] + "...") if Settings.NOTION_DATABASE_ID else "not configured"
         logger.info(f"📄 Notion DB: {db_id_display}")
@@ -330,6 +368,8 @@ def main():
     except ValueError as e:
         logger.error("❌ %s", e)
         sys.exit(1)
+    if os.getenv("DEBUG_CONFIG"):
+        logger.info("📋 Config summary: %s", Settings.get_summary())
 
     # Create and run agent
     agent = PollingAgent(interval=args.interval)
@@ -95,6 +95,10 @@ class Settings:
     # This setting is kept for reference but not currently used
     GITHUB_COMMITS_TOOL_NAME: str = os.getenv("GITHUB_COMMITS_TOOL_NAME", "github_pull_commits_list")
 
+    # Page size for the polling agent's closed-PR list (clamped to GitHub's 1..100 range)
+    # Only the first page of recently updated closed PRs is read
+    GITHUB_PRS_PER_PAGE: int = max(1, min(100, int(os.getenv("GITHUB_PRS_PER_PAGE", "30"))))
+
     #
 
     # ============================================================================
@@ -150,6 +154,18 @@ class Settings:
     RESYNC_ON_START: bool = os.getenv("RESYNC_ON_START", "false").lower() in ("1", "true", "yes")
     RESYNC_LOOKBACK_SECONDS: int = int(os.getenv("RESYNC_LOOKBACK_SECONDS", "3600"))
 
+    # How far back (in hours) polling_server.py looks for merged PRs
+    POLL_MERGED_LOOKBACK_HOURS: int = int(os.getenv("POLL_MERGED_LOOKBACK_HOURS", "24"))
+
+    # Maximum number of merged PRs processed concurrently in one polling cycle
+    # Each PR's Notion upsert + Slack notification is independent and I/O-bound
+    POLL_MAX_CONCURRENT: int = int(os.getenv("POLL_MAX_CONCURRENT", "4"))
+
+    # Pause (in seconds) each worker takes after processing a PR (negative -> 0)
+    # The delay is per worker, so POLL_MAX_CONCURRENT workers raise the request
+    # rate N× over the old serial 2s gap; raise this to keep the same spacing
+    POLL_PR_DELAY_SECONDS: float = max(0.0, float(os.getenv("POLL_PR_DELAY_SECONDS", "2")))
+
     # ============================================================================
     # USER MAPPING FILE
     # ============================================================================
@@ -284,15 +300,3 @@ class Settings:
             "notion_configured": notion_ready,
             "webhook_secret_configured": bool(cls.GITHUB_WEBHOOK_SECRET),
         }
-
-
-# Validate configuration on import (fail fast if misconfigured)
-try:
-    Settings.validate()
-    print("✅ Configuration loaded successfully")
-    print(f"📋 Config summary: {Settings.get_summary()}")
-except ValueError as e:
-    print(f"❌ Configuration error: {e}")
-    print("⚠️  Please create a .env file with required variables")
-    print("📖 See README.md for setup instructions")
-    # Don't raise here to allow imports, but validation will fail at runtime
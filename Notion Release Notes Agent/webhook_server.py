@@ -141,22 +141,8 @@ def _post_slack_link(notion_url: str, ctx: PRContext) -> None:
         logger.info("SLACK_ANNOUNCE_CHANNEL not set; skipping Slack notification")
         return
     connector = get_connector()
-    # Pick any mapped user to execute Slack tool; prefer first mapping
-    try:
-        import json as _json
-        from pathlib import Path
-        mpath = Path(Settings.USER_MAPPING_FILE)
-        if mpath.exists():
-            mappings = _json.loads(mpath.read_text() or "{}")
-            if mappings:
-                _, info = next(iter(mappings.items()))
-                identifier = info.get("scalekit_identifier")
-            else:
-                identifier = None
-        else:
-            identifier = None
-    except Exception:
-        identifier = None
+    # Same identifier used for the Notion upsert (cached until user_mapping.json changes)
+    identifier = _resolve_identifier()
 
     if not identifier:
         logger.warning("No user mapping found; cannot send Slack message via Scalekit")
@@ -396,6 +382,15 @@ def auth_init():
 
 
 def run():
+    # Validate configuration (fail fast if misconfigured)
+    try:
+        Settings.validate()
+    except ValueError as e:
+        logger.error("❌ %s", e)
+        raise SystemExit(1)
+    if os.getenv("DEBUG_CONFIG"):
+        logger.info("📋 Config summary: %s", Settings.get_summary())
+
     # Startup config warnings to help setup
     if Settings.NOTION_VIA_SCALEKIT:
         if not Settings.NOTION_DATABASE_ID:
@@ -1,6 +1,8 @@
-from settings import Settings
-from service import app
+from settings import Settings, validate_or_exit
 
 
 if __name__ == "__main__":
-    app.run(host=Settings.FLASK_HOST, port=Settings.FLASK_PORT)
\ No newline at end of file
+    # Validate before importing service, which creates the connector on import
+    validate_or_exit()
+    from service import app
+    app.run(host=Settings.FLASK_HOST, port=Settings.FLASK_PORT)
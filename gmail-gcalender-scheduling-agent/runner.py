@@ -4,6 +4,13 @@ from datetime import datetime, timedelta
 import os
 import time
 import pytz
+from settings import validate_or_exit
+
+# Validate before importing gmail_api/calendar_api, which create the
+# connector on import and raise on missing Scalekit credentials
+if __name__ == "__main__":
+    validate_or_exit()
+
 from sk_connectors import get_connector
 from gmail_api import fetch_emails, get_message
 from calendar_api import list_calendars, list_events, create_event
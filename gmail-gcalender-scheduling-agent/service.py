@@ -3,11 +3,15 @@ from __future__ import annotations
 import os
 from flask import Flask, jsonify, request, redirect
 from dotenv import load_dotenv
+from settings import validate_or_exit
 from sk_connectors import get_connector
 
 load_dotenv()
 
 app = Flask(__name__)
+if __name__ == "__main__":
+    # Fail fast with a readable error before the connector is created
+    validate_or_exit()
 connector = get_connector()
 
 @app.get("/health")
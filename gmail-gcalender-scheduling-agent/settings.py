@@ -146,13 +146,18 @@ class Settings:
         }
 
 
-# Validate configuration on import (fail fast if misconfigured)
-try:
-    Settings.validate()
-    print("✅ Configuration loaded successfully")
-    print(f"📋 Config summary: {Settings.get_summary()}")
-except ValueError as e:
-    print(f"❌ Configuration error: {e}")
-    print("⚠️  Please create a .env file with required variables")
-    print("📖 See README.md for setup instructions")
-    # Don't raise here to allow imports, but validation will fail at runtime
+def validate_or_exit() -> None:
+    """
+    Validate configuration at an entry point, exiting with status 1 on error.
+
+    Prints the config summary when DEBUG_CONFIG is set.
+    """
+    try:
+        Settings.validate()
+    except ValueError as e:
+        print(f"❌ Configuration error: {e}")
+        print("⚠️  Please create a .env file with required variables")
+        print("📖 See README.md for setup instructions")
+        raise SystemExit(1)
+    if os.getenv("DEBUG_CONFIG"):
+        print(f"📋 Config summary: {Settings.get_summary()}")
@@ -221,7 +221,7 @@ class Actions:
                 message="Slack message sent",
                 data={
                     "channel": channel_id,
-                    "timestamp": result.get("ts", "")
+                    "timestamp": _extract_ts(result) or ""
                 }
             )
         else:
@@ -279,6 +279,25 @@ class Actions:
             return f"✅ {action_result.message}\n_Time: {timestamp}_"
 
 
+def _extract_ts(result: Any) -> Optional[str]:
+    """
+    Extract the message timestamp from a slack_send_message result.
+
+    Handles both a plain dict and an ExecuteToolResponse (payload in .data),
+    checking the common dict shape first.
+
+    Args:
+        result: Raw result returned by the Scalekit connector
+
+    Returns:
+        Slack message timestamp, or None if not present
+    """
+    data = result if isinstance(result, dict) else getattr(result, "data", None)
+    if isinstance(data, dict):
+        return data.get("ts") or data.get("timestamp")
+    return None
+
+
 # Global actions instance
 # Initialized once and reused across the application
 _actions: Optional[Actions] = None
@@ -19,6 +19,7 @@ Benefits:
 - Unified API for all services
 """
 
+import functools
 import json
 import time
 from datetime import datetime, timedelta
@@ -29,9 +30,14 @@ from flask import Flask, jsonify
 from markupsafe import escape
 
 from routing import get_router
-from settings import Settings
+from settings import Settings, validate_or_exit
 from sk_connectors import get_connector
 
+# Validate before the router and connector below are created, since the
+# connector raises on missing Scalekit credentials
+if __name__ == "__main__":
+    validate_or_exit()
+
 # Initialize Flask app for health checks and auth endpoints
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
@@ -82,6 +88,17 @@ def get_slack_identifier(user_id: str, user_mappings: Dict) -> str:
     return user_mappings[user_id].get('scalekit_identifier')
 
 
+def _response_data(result: Any) -> Dict:
+    """
+    Return the payload dict from a Scalekit tool result.
+
+    Results may be a plain dict or an ExecuteToolResponse with the payload
+    in .data; anything else yields an empty dict.
+    """
+    data = result if isinstance(result, dict) else getattr(result, 'data', None)
+    return data if isinstance(data, dict) else {}
+
+
 def fetch_channel_messages(channel_id: str, identifier: str, limit: int = 10) -> List[Dict]:
     """
     Fetch recent messages from a Slack channel via Scalekit.
@@ -127,11 +144,7 @@ def fetch_channel_messages(channel_id: str, identifier: str, limit: int = 10) ->
 
         # Result from Scalekit is an ExecuteToolResponse object
         # The actual data is in result.data dictionary
-        messages = []
-        if hasattr(result, 'data') and isinstance(result.data, dict):
-            messages = result.data.get('messages', [])
-        elif isinstance(result, dict):
-            messages = result.get('messages', [])
+        messages = _response_data(result).get('messages', [])
 
         print(f"✅ Fetched {len(messages)} messages from {channel_id}")
 
@@ -165,6 +178,20 @@ def fetch_channel_messages(channel_id: str, identifier: str, limit: int = 10) ->
         return []
 
 
+@functools.lru_cache(maxsize=4096)
+def format_message_ts(message_ts: str) -> str:
+    """
+    Format a Slack message timestamp as local HH:MM:SS for logging.
+
+    Cached because each poll re-fetches the overlap window, so the same
+    (already processed) message timestamps are formatted again every cycle.
+    """
+    try:
+        return datetime.fromtimestamp(float(message_ts)).strftime('%H:%M:%S')
+    except (TypeError, ValueError):
+        return str(message_ts)
+
+
 def is_message_processed(channel_id: str, message_ts: str) -> bool:
     """Check if a message has already been processed."""
     if channel_id not in processed_messages:
@@ -501,12 +528,7 @@ def poll_channels(user_mappings: Dict):
                                 'oldest': str(oldest_time)
                             }
                         )
-                        alt_messages = []
-                        if result:
-                            if hasattr(result, 'data') and isinstance(result.data, dict):
-                                alt_messages = result.data.get('messages', [])
-                            elif isinstance(result, dict):
-                                alt_messages = result.get('messages', [])
+                        alt_messages = _response_data(result).get('messages', []) if result else []
                         print(f"   ↻ Fallback fetched {len(alt_messages)} messages")
                         # Use whichever list is non-empty (prefer fallback if it found any)
                         if alt_messages:
@@ -524,8 +546,7 @@ def poll_channels(user_mappings: Dict):
                 for message in reversed(messages):  # Process oldest first
                     message_ts = message.get('ts')
                     message_text = message.get('text', '')[:80]
-                    from datetime import datetime
-                    readable_ts = datetime.fromtimestamp(float(message_ts)).strftime('%H:%M:%S')
+                    readable_ts = format_message_ts(message_ts)
 
                     # Skip if already processed
                     if is_message_processed(channel_id, message_ts):